@@ -9,7 +9,8 @@ MIT License
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib, Gdk
+from gi.repository import Gtk, GLib, Gdk, Gio
+import cairo
 try:
     gi.require_version('AyatanaAppIndicator3', '0.1')
     from gi.repository import AyatanaAppIndicator3 as AppIndicator3
@@ -32,14 +33,53 @@ import signal
 import re
 import sys
 import shlex
-from collections import deque
+from array import array
+
+# Use orjson's C encoder/decoder for the config file when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def load_json_bytes(data):
+    """Parse JSON from bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json_bytes(obj):
+    """Serialize obj to indented JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+_EXECUTABLE_CACHE = {}
+
+
+def find_executable(name):
+    """Return the PATH location of an executable, or None.
+
+    Successful lookups are cached for the lifetime of the process; misses are
+    not, so a tool installed while the app is running is still picked up.
+    """
+    path = _EXECUTABLE_CACHE.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path:
+            _EXECUTABLE_CACHE[name] = path
+    return path
 
 
 def find_freerdp_cmd():
     """Return the available xfreerdp executable name, or None."""
-    if shutil.which("xfreerdp3"):
+    if find_executable("xfreerdp3"):
         return "xfreerdp3"
-    if shutil.which("xfreerdp"):
+    if find_executable("xfreerdp"):
         return "xfreerdp"
     return None
 
@@ -127,6 +167,180 @@ def build_rdp_command(conn, freerdp_cmd, rdp_password):
     return cmd
 
 
+_OPENVPN3_SESSION_RE = re.compile(rb'/net/openvpn/v3/sessions/[a-f0-9s]+')
+
+# "iface: rx_bytes rx_packets ... (8 receive fields) tx_bytes ..."
+_NETDEV_RE = re.compile(r'^\s*([^\s:]+):\s*(\d+)(?:\s+\d+){7}\s+(\d+)', re.MULTILINE)
+
+
+def read_netdev():
+    """Return {interface: (rx_bytes, tx_bytes)} parsed from /proc/net/dev."""
+    with open("/proc/net/dev", "r") as f:
+        data = f.read()
+    return {
+        iface: (int(rx), int(tx))
+        for iface, rx, tx in _NETDEV_RE.findall(data)
+    }
+
+
+# `openvpn3 session-stats` lines look like "     BYTES_IN.........1234";
+# anchoring at the line start leaves out the TUN_BYTES_* counters.
+_OPENVPN3_STATS_RE = re.compile(r'^[ \t]*(BYTES_IN|BYTES_OUT)\b[.\s]*(\d+)', re.MULTILINE)
+
+
+def parse_openvpn3_stats(output):
+    """Return (bytes_in, bytes_out) from `openvpn3 session-stats` output."""
+    stats = {}
+    for match in _OPENVPN3_STATS_RE.finditer(output):
+        stats[match.group(1)] = int(match.group(2))
+        if len(stats) == 2:
+            # Both counters found, no need to scan the rest of the output
+            break
+    return stats.get("BYTES_IN", 0), stats.get("BYTES_OUT", 0)
+
+
+def fetch_openvpn3_stats(session_path):
+    """Return (bytes_in, bytes_out) for a session straight from D-Bus.
+
+    Reads the session object's "statistics" property from the OpenVPN3
+    session manager, which is what `openvpn3 session-stats` prints, without
+    starting a process. Raises GLib.Error if the bus call fails.
+    """
+    bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+    reply = bus.call_sync(
+        "net.openvpn.v3.sessions",
+        session_path,
+        "org.freedesktop.DBus.Properties",
+        "Get",
+        GLib.Variant("(ss)", ("net.openvpn.v3.sessions", "statistics")),
+        GLib.VariantType.new("(v)"),
+        Gio.DBusCallFlags.NONE,
+        5000,
+        None
+    )
+    stats = reply.unpack()[0]
+    return stats.get("BYTES_IN", 0), stats.get("BYTES_OUT", 0)
+
+
+def list_vpn_configs(vpn_type):
+    """Return the VPN profiles/config files available for a VPN type."""
+    configs_found = []
+    
+    if vpn_type == "NetworkManager":
+        try:
+            result = subprocess.run(
+                ["nmcli", "-t", "--escape", "no", "-f", "NAME,TYPE", "connection", "show"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=5
+            )
+
+            if result.returncode == 0:
+                for line in result.stdout.decode("utf-8", "replace").splitlines():
+                    if ":" not in line:
+                        continue
+                    name, conn_type = line.rsplit(":", 1)
+                    if conn_type in ["vpn", "wireguard"]:
+                        configs_found.append(name)
+
+                configs_found.sort()
+        except:
+            pass
+
+    elif vpn_type == "OpenVPN3":
+        json_listed = False
+        try:
+            # Newer openvpn3 releases print the list as JSON, keyed by
+            # configuration path; older ones reject --json
+            result = subprocess.run(
+                ["openvpn3", "configs-list", "--json"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=5
+            )
+            
+            if result.returncode == 0:
+                configs = load_json_bytes(result.stdout)
+                configs_found = [
+                    config.get("name") or path for path, config in configs.items()
+                ]
+                json_listed = True
+        except (OSError, subprocess.SubprocessError, ValueError, AttributeError):
+            configs_found = []
+        
+        if not json_listed:
+            try:
+                result = subprocess.run(
+                    ["openvpn3", "configs-list"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
+                )
+                
+                if result.returncode == 0:
+                    lines = result.stdout.decode("utf-8", "replace").strip().split('\n')
+                    configs_found = [
+                        line.split()[0] for line in lines[2:]  # Skip header
+                        if line.strip() and not line.startswith('-')
+                    ]
+            except:
+                pass
+    
+    elif vpn_type == "WireGuard":
+        # Load WireGuard configs from common locations
+        wg_dirs = [
+            "/etc/wireguard",
+            os.path.expanduser("~/.config/wireguard"),
+            os.path.expanduser("~/wireguard")
+        ]
+        
+        for wg_dir in wg_dirs:
+            if os.path.exists(wg_dir):
+                try:
+                    for file in os.listdir(wg_dir):
+                        if file.endswith('.conf'):
+                            config_path = os.path.join(wg_dir, file)
+                            # Check if readable
+                            if os.access(config_path, os.R_OK):
+                                configs_found.append(config_path)
+                            else:
+                                # Try with sudo access notation
+                                configs_found.append(f"sudo:{config_path}")
+                except:
+                    pass
+        
+        configs_found.sort()
+    
+    return configs_found
+
+
+def parse_monitor_list(text):
+    """Parse a "0,1,2" monitor selection.
+
+    Returns (monitors, valid): the listed monitor numbers, and whether every
+    non-empty item was a number.
+    """
+    items = [item.strip() for item in text.split(",")]
+    monitors = [int(item) for item in items if item.isdecimal()]
+    valid = all(item.isdecimal() for item in items if item)
+    return monitors, valid
+
+
+def new_chart_surface(width, height, device_scale):
+    """Create a chart surface of a logical size at the display scale"""
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width * device_scale, height * device_scale)
+    surface.set_device_scale(device_scale, device_scale)
+    return surface
+
+
+def chart_surface_matches(surface, width, height, device_scale):
+    """Check whether a new_chart_surface() fits a logical size and scale"""
+    return (surface is not None
+            and surface.get_width() == width * device_scale
+            and surface.get_height() == height * device_scale
+            and surface.get_device_scale() == (device_scale, device_scale))
+
+
 def suppress_appindicator_deprecation_warning(log_domain, log_level, message):
     """Hide the known libayatana-appindicator deprecation warning."""
     if "libayatana-appindicator is deprecated" in message:
@@ -218,25 +432,39 @@ def package_install_command(package_key):
         return f"sudo apt update && sudo apt install {' '.join(family_packages)}"
     return "Install with your distribution package manager"
 
-# Check if keyring module is available
+# Check if keyring module is available. The resolved backend is kept in
+# KEYRING_BACKEND so password lookups go straight to it.
 try:
     import keyring
-    backend = keyring.get_keyring()
-    backend_name = backend.__class__.__name__.lower()
+    KEYRING_BACKEND = keyring.get_keyring()
+    backend_name = KEYRING_BACKEND.__class__.__name__.lower()
     
     if 'kde' in backend_name or 'kwallet' in backend_name:
         try:
             from keyring.backends import SecretService
-            keyring.set_keyring(SecretService.Keyring())
-            KEYRING_AVAILABLE = True
-        except:
-            KEYRING_AVAILABLE = False
-    else:
-        KEYRING_AVAILABLE = True
-except ImportError:
-    KEYRING_AVAILABLE = False
+            KEYRING_BACKEND = SecretService.Keyring()
+            keyring.set_keyring(KEYRING_BACKEND)
+        except Exception:
+            KEYRING_BACKEND = None
 except Exception:
-    KEYRING_AVAILABLE = False
+    KEYRING_BACKEND = None
+
+KEYRING_AVAILABLE = KEYRING_BACKEND is not None
+
+# Give up on a stalled keyring lookup and prompt for the password instead
+KEYRING_LOOKUP_TIMEOUT = 10  # seconds
+
+# How long listed VPN configs are reused across connection dialogs
+VPN_CONFIG_CACHE_TTL = 30  # seconds
+
+# Foreground color of the status column; any other status is shown in red.
+STATUS_COLORS = {
+    "Connected": "green",
+    "Connecting...": "orange",
+    "Disconnecting...": "orange",
+    "Disconnected": "gray",
+}
+
 
 class VPNRDPManager(Gtk.Window):
     def __init__(self):
@@ -354,6 +582,7 @@ class VPNRDPManager(Gtk.Window):
         
         # List store for connections
         self.liststore = Gtk.ListStore(str, str, str, str, str, str)  # Name, Type, VPN Config, RDP Host, Username, Status
+        self._row_iter_by_name = {}  # Connection name -> its liststore row
         
         # Tree view
         self.treeview = Gtk.TreeView(model=self.liststore)
@@ -382,7 +611,9 @@ class VPNRDPManager(Gtk.Window):
         column.set_resizable(True)
         self.treeview.append_column(column)
         
-        # Status column with color
+        # Status column with color. This keeps its own renderer on purpose:
+        # the cell data func sets "foreground", which sticks to a renderer, so
+        # sharing the one above would bleed status colors into other columns.
         status_renderer = Gtk.CellRendererText()
         column = Gtk.TreeViewColumn("Status", status_renderer, text=5)
         column.set_cell_data_func(status_renderer, self.status_cell_data_func)
@@ -407,6 +638,8 @@ class VPNRDPManager(Gtk.Window):
         self.chart_area = Gtk.DrawingArea()
         self.chart_area.set_size_request(600, 300)
         self.chart_area.connect("draw", self.on_chart_draw)
+        self.chart_area.connect("size-allocate", self.on_chart_size_allocate)
+        self.chart_area.connect("notify::scale-factor", self.on_chart_scale_changed)
         
         # Put drawing area in a frame for visibility
         chart_frame = Gtk.Frame()
@@ -448,16 +681,33 @@ class VPNRDPManager(Gtk.Window):
         chart_container.pack_start(conn_selector_box, False, False, 0)
         
         # Add Traffic Chart tab to notebook
-        self.main_notebook.append_page(chart_container, Gtk.Label(label="Traffic Monitor"))
+        self.chart_page_index = self.main_notebook.append_page(
+            chart_container, Gtk.Label(label="Traffic Monitor")
+        )
         
         # Initialize chart data
         self.chart_data_points = 60  # Number of data points to show
-        self.bytes_in_history = deque([0] * self.chart_data_points, maxlen=self.chart_data_points)
-        self.bytes_out_history = deque([0] * self.chart_data_points, maxlen=self.chart_data_points)
+        # Fixed-size ring buffers of unboxed doubles; _chart_head is the slot
+        # holding the oldest sample, i.e. the next one to be overwritten.
+        self.bytes_in_history = array('d', [0.0]) * self.chart_data_points
+        self.bytes_out_history = array('d', [0.0]) * self.chart_data_points
+        self._chart_head = 0
+        self._chart_repeat_run = 0  # Consecutive samples equal to the one before
+        self._chart_max_in = 0.0  # Largest sample currently in each history
+        self._chart_max_out = 0.0
+        self._stats_pending = False  # An OpenVPN3 stats fetch is in flight
         self.last_bytes_in = {}  # Per connection
         self.last_bytes_out = {}  # Per connection
         self.chart_max_value = 1000  # Initial max value for Y-axis
         self.monitored_connection = None  # Which connection to monitor
+        self._chart_combo_connections = frozenset()  # Listed in the selector
+        self._chart_backbuf = None  # Off-screen surface holding the rendered chart
+        self._chart_grid = None  # Cached background/grid/axes for the chart size
+        self._chart_dirty = False  # Samples arrived while the chart was not visible
+        self._chart_redraw_pending = False  # A coalesced redraw is scheduled
+        self._chart_xs = []  # Sample x coordinates for the width below
+        self._chart_xs_width = None
+        self._waiting_text_width = None  # Measured "Waiting for traffic data..." width
         
         # Control buttons
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -490,9 +740,17 @@ class VPNRDPManager(Gtk.Window):
         
         # Initialize
         self.config_file = os.path.expanduser("~/.config/vpnrdp/connections.json")
+        self._config_write_lock = threading.Lock()
+        self._pending_config = None  # Serialized profiles waiting to be written
+        self._last_saved_config = None  # Bytes of the most recent save
         self.connections = self.load_connections()
         self.active_connections = {}  # Track active VPN sessions and RDP processes
         self.rdp_log_buffers = {}  # name -> (textview, buffer) for live debug logs
+        self._rdp_cmd_cache = {}  # name -> (profile fingerprint, xfreerdp argv)
+        self._delete_confirm_dialog = None  # Reused by delete_connection
+        self._collecting_passwords = False  # Keyring lookup/prompt in progress
+        self._disconnecting = set()  # Profiles whose teardown is still running
+        self._vpn_config_cache = {}  # VPN type -> (time listed, configs)
         self.current_vpn_session = None
         self.current_rdp_process = None
         
@@ -505,11 +763,8 @@ class VPNRDPManager(Gtk.Window):
         # Update status
         self.update_status("Ready")
         
-        # Start status monitor
-        GLib.timeout_add_seconds(2, self.monitor_connections)
-        
-        # Start traffic monitor
-        GLib.timeout_add_seconds(2, self.update_traffic_chart)
+        # Start status and traffic monitor
+        GLib.timeout_add_seconds(2, self.periodic_tick)
         
         # Initialize system tray
         self.init_system_tray()
@@ -632,15 +887,7 @@ class VPNRDPManager(Gtk.Window):
     
     def status_cell_data_func(self, column, cell, model, iter, data):
         """Color code the status column"""
-        status = model.get_value(iter, 5)
-        if status == "Connected":
-            cell.set_property("foreground", "green")
-        elif status == "Connecting...":
-            cell.set_property("foreground", "orange")
-        elif status == "Disconnected":
-            cell.set_property("foreground", "gray")
-        else:
-            cell.set_property("foreground", "red")
+        cell.set_property("foreground", STATUS_COLORS.get(model.get_value(iter, 5), "red"))
     
     def check_dependencies(self):
         """Check if required programs are installed"""
@@ -649,17 +896,17 @@ class VPNRDPManager(Gtk.Window):
         
         # Check for at least one VPN solution
         has_vpn = False
-        if shutil.which("nmcli"):
+        if find_executable("nmcli"):
             has_vpn = True
         else:
             optional_missing.append("NetworkManager")
 
-        if shutil.which("openvpn3"):
+        if find_executable("openvpn3"):
             has_vpn = True
         else:
             optional_missing.append("OpenVPN3")
             
-        if shutil.which("wg") and shutil.which("wg-quick"):
+        if find_executable("wg") and find_executable("wg-quick"):
             has_vpn = True
         else:
             optional_missing.append("WireGuard")
@@ -667,7 +914,7 @@ class VPNRDPManager(Gtk.Window):
         if not has_vpn:
             missing.append("VPN client (NetworkManager, OpenVPN3, or WireGuard)")
         
-        if not shutil.which("xfreerdp") and not shutil.which("xfreerdp3"):
+        if not find_executable("xfreerdp") and not find_executable("xfreerdp3"):
             missing.append("FreeRDP")
         
         if missing:
@@ -695,47 +942,84 @@ class VPNRDPManager(Gtk.Window):
     
     def load_connections(self):
         """Load saved connections from file"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {}
+        try:
+            with open(self.config_file, 'rb') as f:
+                return load_json_bytes(f.read())
+        except (OSError, ValueError):
+            # Missing, unreadable or corrupt config: start with no profiles
+            return {}
     
     def save_connections(self):
-        """Save connections to file"""
-        os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(self.connections, f, indent=2)
-        os.chmod(self.config_file, 0o600)
+        """Save connections to file.
+
+        The profiles are serialized on the calling (main) thread, skipped if
+        unchanged since the last save, and written by a background thread.
+        """
+        data = dump_json_bytes(self.connections)
+        if data == self._last_saved_config:
+            return
+        self._last_saved_config = data
+        self._pending_config = data
+        # Not a daemon thread, so a save still in flight finishes on exit.
+        threading.Thread(target=self._write_config_file).start()
+    
+    def _write_config_file(self):
+        """Atomically replace the config file with the latest pending data"""
+        with self._config_write_lock:
+            data = self._pending_config
+            self._pending_config = None
+            if data is None:
+                # A later writer already flushed the newest data
+                return
+            tmp_path = self.config_file + ".tmp"
+            try:
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.config_file)
+            except OSError as e:
+                print(f"Could not save connections: {e}")
+                # Let the next save retry instead of matching unsaved bytes
+                self._last_saved_config = None
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
     def refresh_connection_list(self):
         """Refresh the connection list display"""
         self.liststore.clear()
-        for name, conn in self.connections.items():
-            status = self.active_connections.get(name, {}).get("status", "Disconnected")
-            conn_type = conn.get("connection_mode", "VPN+RDP")  # Default to VPN+RDP for existing connections
-            
-            # Format display values based on connection type
-            vpn_config = ""
-            rdp_host = ""
-            rdp_username = ""
-            
-            if conn_type in ["VPN+RDP", "VPN Only"]:
-                vpn_config = os.path.basename(conn.get("vpn_config", ""))
-            if conn_type in ["VPN+RDP", "RDP Only"]:
-                rdp_host = conn.get("rdp_host", "")
-                rdp_username = conn.get("rdp_username", "")
-            
-            self.liststore.append([
-                name,
-                conn_type,
-                vpn_config,
-                rdp_host,
-                rdp_username,
-                status
-            ])
+        self._row_iter_by_name = {
+            name: self.liststore.append(self._connection_row(name, conn))
+            for name, conn in self.connections.items()
+        }
+    
+    def _connection_row(self, name, conn):
+        """Build the list store row for a connection profile"""
+        status = self.active_connections.get(name, {}).get("status", "Disconnected")
+        conn_type = conn.get("connection_mode", "VPN+RDP")  # Default to VPN+RDP for existing connections
+        
+        # Format display values based on connection type
+        vpn_config = ""
+        rdp_host = ""
+        rdp_username = ""
+        
+        if conn_type in ["VPN+RDP", "VPN Only"]:
+            vpn_config = os.path.basename(conn.get("vpn_config", ""))
+        if conn_type in ["VPN+RDP", "RDP Only"]:
+            rdp_host = conn.get("rdp_host", "")
+            rdp_username = conn.get("rdp_username", "")
+        
+        return [
+            name,
+            conn_type,
+            vpn_config,
+            rdp_host,
+            rdp_username,
+            status
+        ]
     
     def new_connection(self, widget):
         """Create a new connection profile"""
@@ -748,13 +1032,15 @@ class VPNRDPManager(Gtk.Window):
                 name = conn_data["name"]
                 self.connections[name] = conn_data
                 self.save_connections()
-                self.refresh_connection_list()
+                self._row_iter_by_name[name] = self.liststore.append(self._connection_row(name, conn_data))
                 self.update_status(f"Created connection: {name}")
         
         dialog.destroy()
     
     def edit_connection(self, widget):
         """Edit selected connection"""
+        if self._collecting_passwords:
+            return  # A connection is still reading its profile
         selection = self.treeview.get_selection()
         model, iter = selection.get_selected()
         
@@ -770,39 +1056,52 @@ class VPNRDPManager(Gtk.Window):
                         # If name changed, remove old entry
                         if conn_data["name"] != name:
                             del self.connections[name]
+                        self._rdp_cmd_cache.pop(name, None)
+                        self._rdp_cmd_cache.pop(conn_data["name"], None)
                         
                         self.connections[conn_data["name"]] = conn_data
                         self.save_connections()
-                        self.refresh_connection_list()
+                        # Update the edited row in place rather than rebuilding the list
+                        self.liststore.set_row(iter, self._connection_row(conn_data["name"], conn_data))
+                        self._row_iter_by_name.pop(name, None)
+                        self._row_iter_by_name[conn_data["name"]] = iter
                         self.update_status(f"Updated connection: {conn_data['name']}")
                 
                 dialog.destroy()
     
     def delete_connection(self, widget):
         """Delete selected connection"""
+        if self._collecting_passwords:
+            return  # A connection is still reading its profile
         selection = self.treeview.get_selection()
         model, iter = selection.get_selected()
         
         if iter:
             name = model.get_value(iter, 0)
             
-            dialog = Gtk.MessageDialog(
-                transient_for=self,
-                flags=0,
-                message_type=Gtk.MessageType.QUESTION,
-                buttons=Gtk.ButtonsType.YES_NO,
-                text=f"Delete connection '{name}'?"
-            )
-            dialog.format_secondary_text("This action cannot be undone.")
+            # The confirmation dialog is built once and hidden between uses
+            dialog = self._delete_confirm_dialog
+            if dialog is None:
+                dialog = Gtk.MessageDialog(
+                    transient_for=self,
+                    flags=0,
+                    message_type=Gtk.MessageType.QUESTION,
+                    buttons=Gtk.ButtonsType.YES_NO
+                )
+                dialog.format_secondary_text("This action cannot be undone.")
+                self._delete_confirm_dialog = dialog
+            dialog.set_property("text", f"Delete connection '{name}'?")
             
             response = dialog.run()
-            dialog.destroy()
+            dialog.hide()
             
             if response == Gtk.ResponseType.YES:
                 if name in self.connections:
                     del self.connections[name]
+                    self._rdp_cmd_cache.pop(name, None)
                     self.save_connections()
-                    self.refresh_connection_list()
+                    self._row_iter_by_name.pop(name, None)
+                    self.liststore.remove(iter)
                     self.update_status(f"Deleted connection: {name}")
     
     def on_row_activated(self, treeview, path, column):
@@ -832,6 +1131,10 @@ class VPNRDPManager(Gtk.Window):
             return
         
         # Check if already connecting or connected
+        if self._collecting_passwords:
+            return  # Still looking up passwords for a connection
+        if name in self._disconnecting:
+            return  # Previous session is still being torn down
         if name in self.active_connections:
             status = self.active_connections[name].get("status", "")
             if status in ["Connecting...", "Connected", "VPN Connected"]:
@@ -852,8 +1155,12 @@ class VPNRDPManager(Gtk.Window):
 
     def show_connecting_dialog(self, name, conn, debug=False):
         """Show a dialog while connecting"""
+        profile = conn
         conn = dict(conn)
-        if not self.collect_connection_passwords(name, conn):
+        # The UI stays live during keyring lookups, so the profile must still
+        # be the one being connected once the passwords are in
+        if (not self.collect_connection_passwords(name, conn)
+                or self.connections.get(name) is not profile):
             self.update_connection_status(name, "Canceled")
             self.update_status("Connection canceled")
             self.connect_button.set_sensitive(True)
@@ -956,6 +1263,13 @@ class VPNRDPManager(Gtk.Window):
 
     def collect_connection_passwords(self, name, conn):
         """Prompt for passwords on the GTK main thread before worker startup."""
+        self._collecting_passwords = True
+        try:
+            return self._collect_connection_passwords(name, conn)
+        finally:
+            self._collecting_passwords = False
+
+    def _collect_connection_passwords(self, name, conn):
         connection_mode = conn.get("connection_mode", "VPN+RDP")
         vpn_type = conn.get("vpn_type", "OpenVPN3")
 
@@ -980,178 +1294,141 @@ class VPNRDPManager(Gtk.Window):
         dialog.response(response)
         return False
 
-    def safe_set_connecting_status(self, dialog, message):
-        """Update connecting status only while the dialog is current."""
-        if self.connecting_canceled or self.connecting_dialog is not dialog:
-            return False
-        self.connecting_status_label.set_text(message)
-        return False
+    def apply_connecting_update(self, dialog, name, update):
+        """Apply one batch of connection progress updates on the main thread.
 
-    def safe_set_connecting_progress(self, dialog, fraction):
-        """Update connecting progress only while the dialog is current."""
-        if self.connecting_canceled or self.connecting_dialog is not dialog:
-            return False
-        self.connecting_progress.set_fraction(fraction)
+        The dialog widgets are only touched while the dialog is current; the
+        connection list, status bar and buttons are always updated.
+        """
+        if not self.connecting_canceled and self.connecting_dialog is dialog:
+            if "message" in update:
+                self.connecting_status_label.set_text(update["message"])
+            if "fraction" in update:
+                self.connecting_progress.set_fraction(update["fraction"])
+        if "connection_status" in update:
+            self.update_connection_status(name, update["connection_status"])
+        if "status" in update:
+            self.update_status(update["status"])
+        if "connected" in update:
+            self.update_buttons(update["connected"])
         return False
     
     def connection_worker_with_dialog(self, name, conn, dialog, debug=False):
         """Worker thread for establishing connection with dialog updates"""
+        def post(**update):
+            GLib.idle_add(self.apply_connecting_update, dialog, name, update)
+        
+        def fail(connection_status, status, **update):
+            post(connection_status=connection_status, status=status, connected=False, **update)
+            time.sleep(2)  # Show error briefly
+            GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.CLOSE)
+        
         try:
             connection_mode = conn.get("connection_mode", "VPN+RDP")
+            use_vpn = connection_mode != "RDP Only"
+            use_rdp = connection_mode != "VPN Only"
             
-            # Handle VPN-only connections
-            if connection_mode == "VPN Only":
-                GLib.idle_add(self.safe_set_connecting_status, dialog, "Establishing VPN connection...")
-                GLib.idle_add(self.safe_set_connecting_progress, dialog, 0.5)
+            if use_vpn:
+                # Update dialog: Connecting to VPN
+                post(message="Establishing VPN connection...", fraction=0.25 if use_rdp else 0.5)
                 
                 if self.connecting_canceled:
                     return
                 
-                # Connect to VPN
-                vpn_success = self.connect_vpn(name, conn)
-                
-                if vpn_success:
-                    GLib.idle_add(self.safe_set_connecting_status, dialog, "VPN connection established successfully!")
-                    GLib.idle_add(self.safe_set_connecting_progress, dialog, 1.0)
-                    GLib.idle_add(self.update_connection_status, name, "VPN Connected")
-                    GLib.idle_add(self.update_status, f"VPN connected: {name}")
-                    GLib.idle_add(self.update_buttons, True)
-                    time.sleep(1)
-                    GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.OK)
-                else:
-                    GLib.idle_add(self.safe_set_connecting_status, dialog, "VPN connection failed!")
-                    GLib.idle_add(self.update_connection_status, name, "VPN Failed")
-                    GLib.idle_add(self.update_status, f"VPN connection failed for {name}")
-                    GLib.idle_add(self.update_buttons, False)
-                    time.sleep(2)
-                    GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.CLOSE)
-                return
+                if not self.connect_vpn(name, conn):
+                    fail("VPN Failed", f"VPN connection failed for {name}",
+                         message="VPN connection failed!")
+                    return
             
-            # Handle RDP-only connections
-            elif connection_mode == "RDP Only":
-                GLib.idle_add(self.safe_set_connecting_status, dialog, "Establishing RDP connection...")
-                GLib.idle_add(self.safe_set_connecting_progress, dialog, 0.5)
+            if use_rdp:
+                if use_vpn:
+                    if self.connecting_canceled:
+                        self.disconnect_vpn(name)
+                        return
+                    
+                    # Update dialog: VPN connected, connecting to RDP
+                    post(message="VPN connected! Establishing RDP connection...", fraction=0.75)
+                    
+                    # Give the tunnel a moment to come up before starting RDP
+                    self.wait_for_vpn_ready(name)
+                    
+                    if self.connecting_canceled:
+                        self.disconnect_vpn(name)
+                        return
+                else:
+                    post(message="Establishing RDP connection...", fraction=0.5)
+                    
+                    if self.connecting_canceled:
+                        return
                 
-                if self.connecting_canceled:
+                if not self.connect_rdp(name, conn, debug=debug):
+                    post(message="RDP connection failed!")
+                    if use_vpn:
+                        # RDP failed, disconnect VPN
+                        self.disconnect_vpn(name)
+                    fail("RDP Failed", f"RDP connection failed for {name}")
                     return
-                
-                # Connect to RDP directly
-                rdp_success = self.connect_rdp(name, conn, debug=debug)
-                
-                if rdp_success:
-                    GLib.idle_add(self.safe_set_connecting_status, dialog, "RDP connection established successfully!")
-                    GLib.idle_add(self.safe_set_connecting_progress, dialog, 1.0)
-                    GLib.idle_add(self.update_connection_status, name, "RDP Connected")
-                    GLib.idle_add(self.update_status, f"RDP connected: {name}")
-                    GLib.idle_add(self.update_buttons, True)
-                    time.sleep(1)
-                    GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.OK)
-                else:
-                    GLib.idle_add(self.safe_set_connecting_status, dialog, "RDP connection failed!")
-                    GLib.idle_add(self.update_connection_status, name, "RDP Failed")
-                    GLib.idle_add(self.update_status, f"RDP connection failed for {name}")
-                    GLib.idle_add(self.update_buttons, False)
-                    time.sleep(2)
-                    GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.CLOSE)
-                return
             
-            # Handle VPN+RDP connections (default)
+            if connection_mode == "VPN Only":
+                message, connection_status, status = (
+                    "VPN connection established successfully!", "VPN Connected", f"VPN connected: {name}"
+                )
+            elif connection_mode == "RDP Only":
+                message, connection_status, status = (
+                    "RDP connection established successfully!", "RDP Connected", f"RDP connected: {name}"
+                )
             else:
-                # Update dialog: Connecting to VPN
-                GLib.idle_add(self.safe_set_connecting_status, dialog, "Establishing VPN connection...")
-                GLib.idle_add(self.safe_set_connecting_progress, dialog, 0.25)
-                
-                if self.connecting_canceled:
-                    return
-                
-                # Connect to VPN
-                vpn_success = self.connect_vpn(name, conn)
-                
-                if not vpn_success:
-                    GLib.idle_add(self.safe_set_connecting_status, dialog, "VPN connection failed!")
-                    GLib.idle_add(self.update_connection_status, name, "VPN Failed")
-                    GLib.idle_add(self.update_status, f"VPN connection failed for {name}")
-                    GLib.idle_add(self.update_buttons, False)
-                    time.sleep(2)  # Show error briefly
-                    GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.CLOSE)
-                    return
-                
-                if self.connecting_canceled:
-                    self.disconnect_vpn(name)
-                    return
-                
-                # Update dialog: VPN connected, connecting to RDP
-                GLib.idle_add(self.safe_set_connecting_status, dialog, "VPN connected! Establishing RDP connection...")
-                GLib.idle_add(self.safe_set_connecting_progress, dialog, 0.75)
-                
-                # Wait for VPN to stabilize
-                time.sleep(3)
-                
-                if self.connecting_canceled:
-                    self.disconnect_vpn(name)
-                    return
-                
-                # Connect to RDP
-                rdp_success = self.connect_rdp(name, conn, debug=debug)
-                
-                if rdp_success:
-                    GLib.idle_add(self.safe_set_connecting_status, dialog, "Connection established successfully!")
-                    GLib.idle_add(self.safe_set_connecting_progress, dialog, 1.0)
-                    GLib.idle_add(self.update_connection_status, name, "Connected")
-                    GLib.idle_add(self.update_status, f"Connected to {name}")
-                    GLib.idle_add(self.update_buttons, True)
-                    time.sleep(1)  # Show success briefly
-                    GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.OK)
-                else:
-                    # RDP failed, disconnect VPN
-                    GLib.idle_add(self.safe_set_connecting_status, dialog, "RDP connection failed!")
-                    self.disconnect_vpn(name)
-                    GLib.idle_add(self.update_connection_status, name, "RDP Failed")
-                    GLib.idle_add(self.update_status, f"RDP connection failed for {name}")
-                    GLib.idle_add(self.update_buttons, False)
-                    time.sleep(2)  # Show error briefly
-                    GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.CLOSE)
+                message, connection_status, status = (
+                    "Connection established successfully!", "Connected", f"Connected to {name}"
+                )
+            post(message=message, fraction=1.0, connection_status=connection_status,
+                 status=status, connected=True)
+            time.sleep(1)  # Show success briefly
+            GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.OK)
         
         except Exception as e:
-            GLib.idle_add(self.safe_set_connecting_status, dialog, f"Error: {str(e)}")
-            GLib.idle_add(self.update_connection_status, name, "Error")
-            GLib.idle_add(self.update_status, f"Error connecting to {name}: {str(e)}")
-            GLib.idle_add(self.update_buttons, False)
-            time.sleep(2)  # Show error briefly
-            GLib.idle_add(self.safe_dialog_response, dialog, Gtk.ResponseType.CLOSE)
+            fail("Error", f"Error connecting to {name}: {str(e)}", message=f"Error: {str(e)}")
     
-    def connection_worker(self, name, conn):
-        """Worker thread for establishing connection"""
+    def wait_for_vpn_ready(self, name, timeout=3.0):
+        """Wait until the VPN reports it is up, for at most timeout seconds.
+
+        Returns early as soon as the tunnel is ready or the attempt is canceled,
+        instead of always sleeping for the full stabilization period.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.connecting_canceled and time.monotonic() < deadline:
+            if self.is_vpn_ready(name):
+                return True
+            time.sleep(0.25)
+        return False
+    
+    def is_vpn_ready(self, name):
+        """Return True once the VPN for a connection is fully established"""
+        conn_info = self.active_connections.get(name, {})
+        session = conn_info.get("vpn_session")
+        if conn_info.get("vpn_type") != "OpenVPN3" or not session:
+            # nmcli and wg-quick only return after the tunnel is configured
+            return True
+        
         try:
-            # First, connect to VPN
-            vpn_success = self.connect_vpn(name, conn)
-            
-            if vpn_success:
-                # Wait a moment for VPN to stabilize
-                time.sleep(3)
-                
-                # Then connect to RDP
-                rdp_success = self.connect_rdp(name, conn)
-                
-                if rdp_success:
-                    GLib.idle_add(self.update_connection_status, name, "Connected")
-                    GLib.idle_add(self.update_status, f"Connected to {name}")
-                    GLib.idle_add(self.update_buttons, True)
-                else:
-                    # RDP failed, disconnect VPN
-                    self.disconnect_vpn(name)
-                    GLib.idle_add(self.update_connection_status, name, "RDP Failed")
-                    GLib.idle_add(self.update_status, f"RDP connection failed for {name}")
-                    GLib.idle_add(self.update_buttons, False)
-            else:
-                GLib.idle_add(self.update_connection_status, name, "VPN Failed")
-                GLib.idle_add(self.update_status, f"VPN connection failed for {name}")
-                GLib.idle_add(self.update_buttons, False)
+            result = subprocess.run(
+                ["openvpn3", "sessions-list"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=2
+            )
+        except Exception:
+            return False
         
-        except Exception as e:
-            GLib.idle_add(self.update_connection_status, name, "Error")
-            GLib.idle_add(self.update_status, f"Error connecting to {name}: {str(e)}")
-            GLib.idle_add(self.update_buttons, False)
+        # Each session is a block starting with its path and ending at a
+        # dashed separator; its Status line reads "Client connected" once up.
+        output = result.stdout
+        start = output.find(session.encode())
+        if start < 0:
+            return False
+        end = output.find(b"\n---", start)
+        block = output[start:end] if end >= 0 else output[start:]
+        return b"Client connected" in block
     
     def connect_vpn(self, name, conn):
         """Connect to VPN"""
@@ -1235,38 +1512,39 @@ class VPNRDPManager(Gtk.Window):
                 cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.PIPE
             )
             
-            # Provide credentials
-            stdout, stderr = proc.communicate(
-                input=f"{vpn_username}\n{vpn_password}\n",
-                timeout=30
-            )
+            # Provide credentials: two short lines fit in the pipe buffer, so
+            # write them directly; communicate() then closes stdin and reads.
+            try:
+                proc.stdin.write(f"{vpn_username}\n{vpn_password}\n".encode())
+            except BrokenPipeError:
+                pass
+            # Output stays bytes; only the session path itself gets decoded.
+            stdout, stderr = proc.communicate(timeout=30)
             
             if proc.returncode == 0:
                 # Extract session path
-                for line in stdout.split('\n'):
-                    if 'Session path:' in line:
-                        session_path = line.split('Session path:')[1].strip()
-                        self.active_connections[name] = {
-                            "vpn_type": "OpenVPN3",
-                            "vpn_session": session_path,
-                            "status": "VPN Connected"
-                        }
-                        return True
+                _, sep, rest = stdout.partition(b'Session path:')
+                if sep:
+                    session_path = rest.split(b'\n', 1)[0].strip().decode('ascii', 'replace')
+                    self.active_connections[name] = {
+                        "vpn_type": "OpenVPN3",
+                        "vpn_session": session_path,
+                        "status": "VPN Connected"
+                    }
+                    return True
                 
                 # Try alternative format
-                if '/net/openvpn/v3/sessions/' in stdout:
-                    matches = re.findall(r'/net/openvpn/v3/sessions/[a-f0-9s]+', stdout)
-                    if matches:
-                        self.active_connections[name] = {
-                            "vpn_type": "OpenVPN3",
-                            "vpn_session": matches[0],
-                            "status": "VPN Connected"
-                        }
-                        return True
+                match = _OPENVPN3_SESSION_RE.search(stdout)
+                if match:
+                    self.active_connections[name] = {
+                        "vpn_type": "OpenVPN3",
+                        "vpn_session": match.group(0).decode('ascii'),
+                        "status": "VPN Connected"
+                    }
+                    return True
             
             return False
         
@@ -1375,8 +1653,10 @@ class VPNRDPManager(Gtk.Window):
             return False
 
         try:
-            # Build RDP command
-            cmd = build_rdp_command(conn, freerdp_cmd, rdp_password)
+            # Build RDP command. The password is fed on stdin rather than
+            # as /p:, so it never shows up in the process list.
+            cmd = self.get_rdp_command(name, conn, freerdp_cmd)
+            cmd.append("/from-stdin:force")
             if debug:
                 cmd.append("/log-level:TRACE")
 
@@ -1393,12 +1673,11 @@ class VPNRDPManager(Gtk.Window):
             if debug:
                 # Open the live log window and merge stderr into stdout so a
                 # single reader thread can stream the whole TRACE log.
-                display_cmd = env_prefix + " ".join(
-                    shlex.quote(c) for c in build_rdp_command(conn, freerdp_cmd, None)
-                ) + " /log-level:TRACE"
+                display_cmd = env_prefix + " ".join(shlex.quote(c) for c in cmd)
                 GLib.idle_add(self.open_rdp_log_window, name, display_cmd)
                 proc = subprocess.Popen(
                     cmd,
+                    stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     text=True,
@@ -1410,18 +1689,29 @@ class VPNRDPManager(Gtk.Window):
                 )
                 reader.start()
             else:
-                # Start RDP process
+                # Start RDP process. Its output is never read, so it must not
+                # go to pipes: a chatty client would fill them and stall.
                 proc = subprocess.Popen(
                     cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     text=True,
                     env=env
                 )
 
-            # Check if it started successfully
-            time.sleep(2)
-            if proc.poll() is None:
+            # /from-stdin:force reads the password before connecting
+            try:
+                proc.stdin.write(f"{rdp_password}\n")
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+            # Check if it started successfully: a client that fails to start
+            # exits within the grace period, so stop waiting as soon as it does
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
                 # Process is running
                 if name in self.active_connections:
                     self.active_connections[name]["rdp_process"] = proc
@@ -1439,6 +1729,22 @@ class VPNRDPManager(Gtk.Window):
             print(f"RDP connection error: {e}")
             return False
 
+    def get_rdp_command(self, name, conn, freerdp_cmd):
+        """Return the password-less xfreerdp argv for a profile.
+
+        The argv only depends on the saved profile, so it is built once per
+        connection and reused while the profile's fingerprint still matches.
+        """
+        # Leave out runtime-only keys such as the collected passwords
+        fingerprint = dump_json_bytes(
+            {key: value for key, value in conn.items() if not key.startswith("_")}
+        )
+        cached = self._rdp_cmd_cache.get(name)
+        if cached is None or cached[0] != fingerprint or cached[1][0] != freerdp_cmd:
+            cached = (fingerprint, tuple(build_rdp_command(conn, freerdp_cmd, None)))
+            self._rdp_cmd_cache[name] = cached
+        return list(cached[1])
+
     # --- Debug log window ---------------------------------------------------
 
     def open_rdp_log_window(self, name, command_str):
@@ -1578,6 +1884,8 @@ class VPNRDPManager(Gtk.Window):
 
     def disconnect_selected(self, widget):
         """Disconnect selected connection"""
+        if self._collecting_passwords:
+            return  # A connection is still reading its profile
         selection = self.treeview.get_selection()
         model, iter = selection.get_selected()
         
@@ -1586,91 +1894,126 @@ class VPNRDPManager(Gtk.Window):
             self.disconnect(name)
     
     def disconnect(self, name):
-        """Disconnect a specific connection"""
-        if name not in self.active_connections:
+        """Disconnect a specific connection without blocking the UI.
+
+        The RDP client and VPN are torn down on a worker thread. The profile
+        stays "Disconnecting..." and cannot be reconnected until it finishes.
+        """
+        conn_info = self.active_connections.pop(name, None)
+        if conn_info is None:
             return
         
+        self._disconnecting.add(name)
+        self.update_connection_status(name, "Disconnecting...")
         self.update_status(f"Disconnecting {name}...")
+        self.connect_button.set_sensitive(False)
+        self.connect_debug_button.set_sensitive(False)
+        self.disconnect_button.set_sensitive(False)
         
         # Get connection mode
         conn = self.connections.get(name, {})
         connection_mode = conn.get("connection_mode", "VPN+RDP")
         
+        # Not a daemon thread, so quitting still waits for the teardown
+        thread = threading.Thread(
+            target=self.disconnect_worker, args=(name, conn_info, connection_mode)
+        )
+        thread.start()
+    
+    def disconnect_worker(self, name, conn_info, connection_mode):
+        """Worker thread for tearing down a connection after disconnect()"""
         # Disconnect RDP if applicable
         if connection_mode in ["VPN+RDP", "RDP Only"]:
-            if "rdp_process" in self.active_connections[name]:
-                try:
-                    proc = self.active_connections[name]["rdp_process"]
-                    proc.terminate()
-                    proc.wait(timeout=5)
-                except:
-                    try:
-                        proc.kill()
-                    except:
-                        pass
+            if proc := conn_info.get("rdp_process"):
+                self.terminate_rdp_process(proc)
         
         # Disconnect VPN if applicable
         if connection_mode in ["VPN+RDP", "VPN Only"]:
-            self.disconnect_vpn(name)
-        
-        # Clean up
-        if name in self.active_connections:
-            del self.active_connections[name]
+            self.disconnect_vpn_session(conn_info)
         
+        GLib.idle_add(self.finish_disconnect, name)
+    
+    def finish_disconnect(self, name):
+        """Mark a connection disconnected once its teardown is done"""
+        self._disconnecting.discard(name)
         self.update_connection_status(name, "Disconnected")
-        self.update_status(f"Disconnected from {name}")
         self.update_buttons(False)
+        self.update_status(f"Disconnected from {name}")
+        return False
+    
+    def terminate_rdp_process(self, proc, timeout=5):
+        """Terminate an RDP client, killing it if it outlives the timeout"""
+        try:
+            proc.terminate()
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                proc.kill()
+                proc.wait()
+            except OSError:
+                pass
+        except OSError:
+            pass
     
     def disconnect_vpn(self, name):
         """Disconnect VPN session"""
         if name in self.active_connections:
-            conn_info = self.active_connections[name]
-            vpn_type = conn_info.get("vpn_type", "OpenVPN3")
-            
-            if vpn_type == "OpenVPN3":
-                session = conn_info.get("vpn_session")
-                if session:
-                    try:
-                        subprocess.run(
-                            ["openvpn3", "session-manage", "--session-path", session, "--disconnect"],
-                            capture_output=True,
-                            timeout=5
-                        )
-                    except:
-                        pass
-
-            elif vpn_type == "NetworkManager":
-                vpn_config = conn_info.get("vpn_config")
-                if vpn_config:
-                    try:
-                        subprocess.run(
-                            ["nmcli", "connection", "down", "id", vpn_config],
-                            capture_output=True,
-                            timeout=10
-                        )
-                    except:
-                        pass
+            self.disconnect_vpn_session(self.active_connections[name])
+    
+    def disconnect_vpn_session(self, conn_info):
+        """Disconnect the VPN described by an active connection entry"""
+        vpn_type = conn_info.get("vpn_type", "OpenVPN3")
+        
+        if vpn_type == "OpenVPN3":
+            session = conn_info.get("vpn_session")
+            if session:
+                try:
+                    subprocess.run(
+                        ["openvpn3", "session-manage", "--session-path", session, "--disconnect"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=5
+                    )
+                except:
+                    pass
+
+        elif vpn_type == "NetworkManager":
+            vpn_config = conn_info.get("vpn_config")
+            if vpn_config:
+                try:
+                    subprocess.run(
+                        ["nmcli", "connection", "down", "id", vpn_config],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=10
+                    )
+                except:
+                    pass
+        
+        elif vpn_type == "WireGuard":
+            vpn_config = conn_info.get("vpn_config")
+            needs_sudo = conn_info.get("needs_sudo", False)
             
-            elif vpn_type == "WireGuard":
-                vpn_config = conn_info.get("vpn_config")
-                needs_sudo = conn_info.get("needs_sudo", False)
-                
-                if vpn_config:
-                    try:
-                        if needs_sudo:
-                            cmd = ["sudo", "wg-quick", "down", vpn_config]
-                        else:
-                            cmd = ["wg-quick", "down", vpn_config]
-                        
-                        subprocess.run(cmd, capture_output=True, timeout=5)
-                    except:
-                        pass
+            if vpn_config:
+                try:
+                    if needs_sudo:
+                        cmd = ["sudo", "wg-quick", "down", vpn_config]
+                    else:
+                        cmd = ["wg-quick", "down", vpn_config]
+                    
+                    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+                except:
+                    pass
+
+    def periodic_tick(self):
+        """Run the connection monitor and traffic chart update on one timer"""
+        self.monitor_connections()
+        self.update_traffic_chart()
+        return True  # Continue monitoring
     
     def monitor_connections(self):
         """Monitor active connections"""
-        for name in list(self.active_connections.keys()):
-            conn_info = self.active_connections[name]
-
+        for name, conn_info in list(self.active_connections.items()):
             if conn_info.get("vpn_type") == "NetworkManager":
                 vpn_config = conn_info.get("vpn_config")
                 if vpn_config and not self.is_networkmanager_connection_active(vpn_config):
@@ -1678,20 +2021,18 @@ class VPNRDPManager(Gtk.Window):
                     continue
             
             # Check RDP process
-            if "rdp_process" in conn_info:
-                proc = conn_info["rdp_process"]
-                if proc.poll() is not None:
-                    # RDP has closed
-                    self.disconnect(name)
+            proc = conn_info.get("rdp_process")
+            if proc and proc.poll() is not None:
+                # RDP has closed
+                self.disconnect(name)
         
         return True  # Continue monitoring
     
     def update_connection_status(self, name, status):
         """Update status for a specific connection in the list"""
-        for row in self.liststore:
-            if row[0] == name:
-                row[5] = status
-                break
+        iter = self._row_iter_by_name.get(name)
+        if iter is not None:
+            self.liststore.set_value(iter, 5, status)
     
     def update_status(self, message):
         """Update status bar"""
@@ -1704,17 +2045,44 @@ class VPNRDPManager(Gtk.Window):
         self.connect_debug_button.set_sensitive(not connected)
         self.disconnect_button.set_sensitive(connected)
     
+    def lookup_keyring_password(self, key):
+        """Look up a saved password without freezing the UI.
+
+        The Secret Service call runs on a worker thread while a nested main
+        loop keeps the window responsive. Returns None if the lookup fails or
+        takes longer than KEYRING_LOOKUP_TIMEOUT seconds.
+        """
+        result = {}
+        loop = GLib.MainLoop()
+        
+        def worker():
+            try:
+                result["password"] = KEYRING_BACKEND.get_password("vpnrdp", key)
+            except Exception as e:
+                print(f"Keyring lookup failed: {e}")
+            GLib.idle_add(loop.quit)
+        
+        def on_timeout():
+            result["timed_out"] = True
+            print("Keyring lookup timed out")
+            loop.quit()
+            return False
+        
+        threading.Thread(target=worker, daemon=True).start()
+        timeout_id = GLib.timeout_add_seconds(KEYRING_LOOKUP_TIMEOUT, on_timeout)
+        loop.run()
+        if not result.get("timed_out"):
+            GLib.source_remove(timeout_id)
+        return result.get("password")
+    
     def get_password(self, name, service_type):
         """Get password from keyring or prompt"""
         key = f"vpnrdp_{name}_{service_type}"
         
         if KEYRING_AVAILABLE:
-            try:
-                password = keyring.get_password("vpnrdp", key)
-                if password:
-                    return password
-            except:
-                pass
+            password = self.lookup_keyring_password(key)
+            if password:
+                return password
         
         # Prompt for password
         dialog = Gtk.Dialog(
@@ -1757,9 +2125,9 @@ class VPNRDPManager(Gtk.Window):
         if response == Gtk.ResponseType.OK and password:
             if save and KEYRING_AVAILABLE:
                 try:
-                    keyring.set_password("vpnrdp", key, password)
-                except:
-                    pass
+                    KEYRING_BACKEND.set_password("vpnrdp", key, password)
+                except Exception as e:
+                    print(f"Could not save password to keyring: {e}")
             return password
         
         return None
@@ -1772,15 +2140,42 @@ class VPNRDPManager(Gtk.Window):
         else:
             self.monitored_connection = text
     
+    def on_chart_size_allocate(self, widget, allocation):
+        """Re-render the chart back-buffer when the drawing area is resized"""
+        if not chart_surface_matches(self._chart_backbuf, allocation.width,
+                                     allocation.height, widget.get_scale_factor()):
+            self._render_chart_to_backbuf()
+
+    def on_chart_scale_changed(self, widget, pspec):
+        """Re-render the chart at the new resolution when the scale changes"""
+        self._render_chart_to_backbuf()
+        widget.queue_draw()
+
     def on_chart_draw(self, widget, cr):
-        """Draw the traffic chart"""
-        allocation = widget.get_allocation()
-        width = allocation.width
-        height = allocation.height
+        """Blit the pre-rendered traffic chart.
+
+        The draw signal also fires for unrelated repaints (tooltips, popovers,
+        window exposes), so the actual plotting happens in
+        _render_chart_to_backbuf() only when the data or size changes.
+        """
+        if self._chart_backbuf is None or self._chart_dirty:
+            self._render_chart_to_backbuf()
+            if self._chart_backbuf is None:
+                return False
+
+        cr.set_source_surface(self._chart_backbuf, 0, 0)
+        cr.paint()
+        return False
+
+    def _chart_grid_surface(self, width, height, device_scale):
+        """Return the chart's static background, grid and axes for a size"""
+        surface = self._chart_grid
+        if chart_surface_matches(surface, width, height, device_scale):
+            return surface
         
-        # Ensure we have valid dimensions
-        if width <= 0 or height <= 0:
-            return False
+        surface = new_chart_surface(width, height, device_scale)
+        self._chart_grid = surface
+        cr = cairo.Context(surface)
         
         # Background - white
         cr.set_source_rgb(1.0, 1.0, 1.0)
@@ -1815,55 +2210,83 @@ class VPNRDPManager(Gtk.Window):
         cr.line_to(1, height)
         cr.stroke()
         
+        return surface
+    
+    def _render_chart_to_backbuf(self):
+        """Render the traffic chart into the off-screen back-buffer"""
+        allocation = self.chart_area.get_allocation()
+        width = allocation.width
+        height = allocation.height
+        device_scale = self.chart_area.get_scale_factor()
+        
+        # Ensure we have valid dimensions
+        if width <= 0 or height <= 0:
+            return
+        
+        backbuf = self._chart_backbuf
+        if not chart_surface_matches(backbuf, width, height, device_scale):
+            backbuf = new_chart_surface(width, height, device_scale)
+            self._chart_backbuf = backbuf
+        cr = cairo.Context(backbuf)
+        self._chart_dirty = False
+        
+        # Background, grid and axes only change with the size
+        cr.set_source_surface(self._chart_grid_surface(width, height, device_scale), 0, 0)
+        cr.paint()
+        
         # Draw data if we have any
-        if self.chart_max_value > 0 and len(self.bytes_in_history) > 1:
-            # Calculate point spacing
-            point_spacing = width / max(1, (self.chart_data_points - 1))
+        if self.chart_max_value > 0:
+            # The x coordinates only depend on the width, so reuse them
+            # until the chart is resized
+            xs = self._chart_xs
+            if self._chart_xs_width != width:
+                point_spacing = width / max(1, (self.chart_data_points - 1))
+                xs = [i * point_spacing for i in range(self.chart_data_points)]
+                self._chart_xs = xs
+                self._chart_xs_width = width
+            
+            # Compute the polyline coordinates once per series (use 85% of
+            # height) so the cairo loops below only issue line_to calls.
+            y_scale = height * 0.85 / self.chart_max_value
+            ys_out = [height - value * y_scale for value in self._ordered_history(self.bytes_out_history)]
+            ys_in = [height - value * y_scale for value in self._ordered_history(self.bytes_in_history)]
+            
+            # Each series' polyline is built once: it is copied, closed down
+            # to the baseline for the filled area and then replayed for the line.
+            line_to = cr.line_to
             
             # Draw filled area for bytes out (blue)
-            cr.set_source_rgba(0.13, 0.59, 0.95, 0.3)  # Semi-transparent blue
-            cr.move_to(0, height)
-            for i, value in enumerate(self.bytes_out_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)  # Use 85% of height
-                cr.line_to(x, y)
+            cr.move_to(xs[0], ys_out[0])
+            for x, y in zip(xs, ys_out):
+                line_to(x, y)
+            line_path = cr.copy_path()
             cr.line_to(width, height)
+            cr.line_to(0, height)
             cr.close_path()
+            cr.set_source_rgba(0.13, 0.59, 0.95, 0.3)  # Semi-transparent blue
             cr.fill()
             
             # Draw line for bytes out (blue)
+            cr.append_path(line_path)
             cr.set_source_rgb(0.13, 0.59, 0.95)  # #2196F3
             cr.set_line_width(2)
-            for i, value in enumerate(self.bytes_out_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)
-                if i == 0:
-                    cr.move_to(x, y)
-                else:
-                    cr.line_to(x, y)
             cr.stroke()
             
             # Draw filled area for bytes in (green)
-            cr.set_source_rgba(0.30, 0.69, 0.31, 0.3)  # Semi-transparent green
-            cr.move_to(0, height)
-            for i, value in enumerate(self.bytes_in_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)
-                cr.line_to(x, y)
+            cr.move_to(xs[0], ys_in[0])
+            for x, y in zip(xs, ys_in):
+                line_to(x, y)
+            line_path = cr.copy_path()
             cr.line_to(width, height)
+            cr.line_to(0, height)
             cr.close_path()
+            cr.set_source_rgba(0.30, 0.69, 0.31, 0.3)  # Semi-transparent green
             cr.fill()
             
             # Draw line for bytes in (green)
+            cr.append_path(line_path)
             cr.set_source_rgb(0.30, 0.69, 0.31)  # #4CAF50
             cr.set_line_width(2)
-            for i, value in enumerate(self.bytes_in_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)
-                if i == 0:
-                    cr.move_to(x, y)
-                else:
-                    cr.line_to(x, y)
             cr.stroke()
         else:
             # No data - show message
@@ -1871,8 +2294,10 @@ class VPNRDPManager(Gtk.Window):
             cr.select_font_face("Sans", 0, 0)
             cr.set_font_size(14)
             text = "Waiting for traffic data..."
-            text_extents = cr.text_extents(text)
-            x = (width - text_extents.width) / 2
+            # The text's extents do not depend on the chart size; measure once
+            if self._waiting_text_width is None:
+                self._waiting_text_width = cr.text_extents(text).width
+            x = (width - self._waiting_text_width) / 2
             y = height / 2
             cr.move_to(x, y)
             cr.show_text(text)
@@ -1882,36 +2307,78 @@ class VPNRDPManager(Gtk.Window):
         cr.set_line_width(1)
         cr.rectangle(0.5, 0.5, width - 1, height - 1)
         cr.stroke()
-        
-        return False
     
+    def _window_shown(self):
+        """Return True if the main window is visible and not minimized"""
+        if not self.get_visible():
+            return False
+        window = self.get_window()
+        return window is not None and not window.get_state() & Gdk.WindowState.ICONIFIED
+
+    def _chart_visible(self):
+        """Return True if the traffic chart is currently on screen"""
+        return self._window_shown() and self.main_notebook.get_current_page() == self.chart_page_index
+
+    def _refresh_chart(self, changed=True):
+        """Re-render the chart after new samples, or defer it while hidden.
+
+        History keeps being recorded either way; a deferred render happens on
+        the next draw, i.e. when the chart tab is shown again. Nothing is done
+        when the new sample left the picture unchanged. Refreshes requested
+        within one frame (16 ms) are coalesced into a single render.
+        """
+        if not changed:
+            return
+        if self._chart_visible():
+            if not self._chart_redraw_pending:
+                self._chart_redraw_pending = True
+                GLib.timeout_add(16, self._redraw_chart)
+        else:
+            self._chart_dirty = True
+
+    def _redraw_chart(self):
+        """Render and repaint the chart once per coalesced refresh"""
+        self._chart_redraw_pending = False
+        self._render_chart_to_backbuf()
+        self.chart_area.queue_draw()
+        return False
+
     def update_traffic_chart(self):
         """Update traffic chart data"""
+        if not self._window_shown():
+            # Nothing can show the chart while the window is hidden to the
+            # tray or minimized, so skip fetching stats. Forgetting the
+            # counters keeps the first sample after restoring from spiking
+            # with all the traffic of the hidden period.
+            self.last_bytes_in.clear()
+            self.last_bytes_out.clear()
+            return True
+        
         try:
             # Determine which connection to monitor
             active_connection = None
+            conn_info = None
             if self.monitored_connection:
                 # Monitor specific connection
-                if self.monitored_connection in self.active_connections:
+                conn_info = self.active_connections.get(self.monitored_connection)
+                if conn_info is not None:
                     active_connection = self.monitored_connection
             else:
                 # Auto mode - find first active connection
                 for name, info in self.active_connections.items():
                     if info.get("status") == "Connected" and "vpn_session" in info:
-                        active_connection = name
+                        active_connection, conn_info = name, info
                         break
             
             if active_connection:
                 # Get VPN statistics
-                conn_info = self.active_connections[active_connection]
                 if conn_info.get("vpn_type") == "WireGuard" or conn_info.get("vpn_session"):
                     self.get_vpn_stats(active_connection, conn_info)
             else:
                 # No active connection - add zero data points
-                self.bytes_in_history.append(0)
-                self.bytes_out_history.append(0)
+                changed = self._append_chart_sample(0, 0)
                 self.chart_stats_label.set_markup("<small>No active VPN connection</small>")
-                self.chart_area.queue_draw()
+                self._refresh_chart(changed)
         except Exception as e:
             print(f"Error updating traffic chart: {e}")
         
@@ -1930,83 +2397,107 @@ class VPNRDPManager(Gtk.Window):
             if not session_path:
                 return
             
+            # session-stats is a D-Bus round trip that can take a while, so
+            # fetch it off the main loop; skip ticks while one is in flight.
+            if self._stats_pending:
+                return
+            self._stats_pending = True
+            thread = threading.Thread(
+                target=self.openvpn3_stats_worker,
+                args=(connection_name, session_path),
+                daemon=True
+            )
+            thread.start()
+        
+        elif vpn_type == "WireGuard":
+            interface_name = session_info.get("vpn_interface", "wg0")
+            
             try:
-                result = subprocess.run(
-                    ["openvpn3", "session-stats", "--session-path", session_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                if result.returncode == 0:
-                    bytes_in_value = 0
-                    bytes_out_value = 0
-                    
-                    # Parse statistics
-                    for line in result.stdout.split('\n'):
-                        # Look for BYTES_IN but not TUN_BYTES_IN
-                        if 'BYTES_IN' in line and not line.strip().startswith('TUN_'):
-                            try:
-                                if '.' in line:
-                                    value_str = line.split('.')[-1].strip()
-                                    bytes_in_value = int(value_str)
-                            except:
-                                pass
-                        # Look for BYTES_OUT but not TUN_BYTES_OUT
-                        elif 'BYTES_OUT' in line and not line.strip().startswith('TUN_'):
-                            try:
-                                if '.' in line:
-                                    value_str = line.split('.')[-1].strip()
-                                    bytes_out_value = int(value_str)
-                            except:
-                                pass
+                # Interface counters are world-readable in /proc/net/dev, so
+                # this needs neither a `wg show` subprocess nor sudo.
+                counters = read_netdev().get(interface_name)
+                if counters:
+                    bytes_in_value, bytes_out_value = counters
                     
                     # Update chart data
                     self.update_chart_data(connection_name, bytes_in_value, bytes_out_value)
             except Exception as e:
-                print(f"Error getting OpenVPN3 stats: {e}")
-        
-        elif vpn_type == "WireGuard":
-            interface_name = session_info.get("vpn_interface", "wg0")
-            needs_sudo = session_info.get("needs_sudo", False)
-            
+                print(f"Error getting WireGuard stats: {e}")
+    
+    def openvpn3_stats_worker(self, connection_name, session_path):
+        """Worker thread for fetching OpenVPN3 session statistics"""
+        stats = None
+        try:
             try:
-                # Get WireGuard statistics
-                if needs_sudo:
-                    cmd = ["sudo", "wg", "show", interface_name, "transfer"]
-                else:
-                    cmd = ["wg", "show", interface_name, "transfer"]
-                
+                stats = fetch_openvpn3_stats(session_path)
+            except GLib.Error:
+                # E.g. no access to the system bus; fall back to the CLI
+                pass
+            
+            if stats is None:
                 result = subprocess.run(
-                    cmd,
+                    ["openvpn3", "session-stats", "--session-path", session_path],
                     capture_output=True,
                     text=True,
                     timeout=5
                 )
                 
                 if result.returncode == 0:
-                    bytes_in_value = 0
-                    bytes_out_value = 0
-                    
-                    # Parse WireGuard output format:
-                    # peer_key<tab>received_bytes<tab>sent_bytes
-                    for line in result.stdout.strip().split('\n'):
-                        if line:
-                            parts = line.split('\t')
-                            if len(parts) >= 3:
-                                try:
-                                    # WireGuard shows received and sent per peer
-                                    # We sum all peers for total traffic
-                                    bytes_in_value += int(parts[1])
-                                    bytes_out_value += int(parts[2])
-                                except:
-                                    pass
-                    
-                    # Update chart data
-                    self.update_chart_data(connection_name, bytes_in_value, bytes_out_value)
-            except Exception as e:
-                print(f"Error getting WireGuard stats: {e}")
+                    stats = parse_openvpn3_stats(result.stdout)
+        except Exception as e:
+            print(f"Error getting OpenVPN3 stats: {e}")
+        finally:
+            GLib.idle_add(self.apply_openvpn3_stats, connection_name, stats)
+    
+    def apply_openvpn3_stats(self, connection_name, stats):
+        """Feed fetched OpenVPN3 statistics into the chart (main thread)"""
+        self._stats_pending = False
+        # The connection may have been closed while the stats were fetched
+        if stats and connection_name in self.active_connections:
+            self.update_chart_data(connection_name, *stats)
+        return False
     
+    def _append_chart_sample(self, in_rate, out_rate):
+        """Write a sample into the chart ring buffers, evicting the oldest.
+
+        Returns False when the rendered chart cannot have changed: the chart
+        scrolls, so that is only the case when every slot already held the
+        same sample before this one (e.g. an idle tunnel reporting zero
+        traffic tick after tick). The sample that first makes the history
+        uniform still evicts an older value and may move the scale.
+        """
+        head = self._chart_head
+        points = self.chart_data_points
+        prev = head - 1  # Index -1 wraps to the newest slot
+        if (self.bytes_in_history[prev] == in_rate
+                and self.bytes_out_history[prev] == out_rate):
+            self._chart_repeat_run += 1
+        else:
+            self._chart_repeat_run = 0
+        evicted_in = self.bytes_in_history[head]
+        evicted_out = self.bytes_out_history[head]
+        self.bytes_in_history[head] = in_rate
+        self.bytes_out_history[head] = out_rate
+        self._chart_head = (head + 1) % points
+        
+        # Keep the per-series maxima current; only evicting the maximum
+        # itself needs a rescan of the history
+        if in_rate >= self._chart_max_in:
+            self._chart_max_in = in_rate
+        elif evicted_in == self._chart_max_in:
+            self._chart_max_in = max(self.bytes_in_history)
+        if out_rate >= self._chart_max_out:
+            self._chart_max_out = out_rate
+        elif evicted_out == self._chart_max_out:
+            self._chart_max_out = max(self.bytes_out_history)
+        # A run of `points` repeats means the evicted slot matched too
+        return self._chart_repeat_run < points
+
+    def _ordered_history(self, history):
+        """Return a ring buffer's samples ordered oldest to newest"""
+        head = self._chart_head
+        return history[head:] + history[:head]
+
     def update_chart_data(self, connection_name, bytes_in, bytes_out):
         """Update chart with new traffic data"""
         # Get last values for this connection
@@ -2025,15 +2516,14 @@ class VPNRDPManager(Gtk.Window):
             out_rate = 0
         
         # Add to history
-        self.bytes_in_history.append(in_rate)
-        self.bytes_out_history.append(out_rate)
+        changed = self._append_chart_sample(in_rate, out_rate)
         
         # Update last values
         self.last_bytes_in[connection_name] = bytes_in
         self.last_bytes_out[connection_name] = bytes_out
         
         # Update max value for scaling
-        max_rate = max(max(self.bytes_in_history), max(self.bytes_out_history))
+        max_rate = max(self._chart_max_in, self._chart_max_out)
         if max_rate > 0:
             # Add some padding to the max value
             self.chart_max_value = max_rate * 1.2
@@ -2052,28 +2542,26 @@ class VPNRDPManager(Gtk.Window):
         # Update connection selector if needed
         self.update_chart_connection_list()
         
-        # Redraw chart
-        self.chart_area.queue_draw()
+        # Redraw chart (a history that was already uniform also leaves
+        # chart_max_value as is)
+        self._refresh_chart(changed)
     
     def update_chart_connection_list(self):
         """Update the connection selector for the chart"""
-        # Get current selection
-        current = self.chart_connection_combo.get_active_text()
-        
         # Get list of active connections
-        active_connections = []
-        for name, info in self.active_connections.items():
-            if info.get("status") == "Connected":
-                active_connections.append(name)
-        
-        # Check if we need to update the list
-        current_items = []
-        model = self.chart_connection_combo.get_model()
-        for row in model:
-            if row[0] != "Auto (Active Connection)":
-                current_items.append(row[0])
-        
-        if set(current_items) != set(active_connections):
+        active_connections = [
+            name for name, info in self.active_connections.items()
+            if info.get("status") == "Connected"
+        ]
+        
+        # Nothing to do unless the set of listed connections changed
+        active_set = frozenset(active_connections)
+        if active_set != self._chart_combo_connections:
+            self._chart_combo_connections = active_set
+            
+            # Get current selection
+            current = self.chart_connection_combo.get_active_text()
+            
             # Update the list
             self.chart_connection_combo.remove_all()
             self.chart_connection_combo.append_text("Auto (Active Connection)")
@@ -2084,11 +2572,8 @@ class VPNRDPManager(Gtk.Window):
             if current == "Auto (Active Connection)" or current not in active_connections:
                 self.chart_connection_combo.set_active(0)
             else:
-                # Find and select the current connection
-                for i, row in enumerate(self.chart_connection_combo.get_model()):
-                    if row[0] == current:
-                        self.chart_connection_combo.set_active(i)
-                        break
+                # Reselect the current connection; row 0 is the Auto entry
+                self.chart_connection_combo.set_active(active_connections.index(current) + 1)
     
     def show_wireguard_install(self, widget):
         """Show WireGuard installation dialog"""
@@ -2251,9 +2736,37 @@ class VPNRDPManager(Gtk.Window):
                         self.show_error(f"Failed to import config:\n{result.stderr}")
                 except Exception as e:
                     self.show_error(f"Failed to import config: {str(e)}")
+            
+            if location_response in (1, 2):
+                # List the imported config the next time a dialog opens
+                self._vpn_config_cache.pop("WireGuard", None)
         
         dialog.destroy()
     
+    def get_vpn_configs(self, vpn_type, callback, refresh=False):
+        """Pass the configs available for a VPN type to callback(configs).
+
+        Listing runs nmcli/openvpn3 or scans the WireGuard directories, so it
+        happens on a worker thread and callback is invoked from the main loop
+        once it is done. The result is shared by connection dialogs for
+        VPN_CONFIG_CACHE_TTL seconds; a cached list is passed back right away
+        unless a refresh is requested.
+        """
+        cached = self._vpn_config_cache.get(vpn_type)
+        if not refresh and cached and time.monotonic() - cached[0] < VPN_CONFIG_CACHE_TTL:
+            callback(cached[1])
+            return
+        
+        def finish(configs):
+            self._vpn_config_cache[vpn_type] = (time.monotonic(), configs)
+            callback(configs)
+            return False
+        
+        def worker():
+            GLib.idle_add(finish, list_vpn_configs(vpn_type))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
     def show_info(self, message):
         """Show info dialog"""
         dialog = Gtk.MessageDialog(
@@ -2307,6 +2820,7 @@ class ConnectionDialog(Gtk.Dialog):
         )
         
         self.set_default_size(600, 800)
+        self.manager = parent
         self.connection_data = connection_data or {}
         self.existing_connections = existing_connections
         
@@ -2384,11 +2898,11 @@ class ConnectionDialog(Gtk.Dialog):
             vpn_types = ["OpenVPN3", "NetworkManager", "WireGuard"]
 
         for vpn_type in vpn_types:
-            if vpn_type == "NetworkManager" and shutil.which("nmcli"):
+            if vpn_type == "NetworkManager" and find_executable("nmcli"):
                 self.vpn_type_combo.append_text(vpn_type)
-            elif vpn_type == "OpenVPN3" and shutil.which("openvpn3"):
+            elif vpn_type == "OpenVPN3" and find_executable("openvpn3"):
                 self.vpn_type_combo.append_text(vpn_type)
-            elif vpn_type == "WireGuard" and shutil.which("wg") and shutil.which("wg-quick"):
+            elif vpn_type == "WireGuard" and find_executable("wg") and find_executable("wg-quick"):
                 self.vpn_type_combo.append_text(vpn_type)
         
         type_box.pack_start(self.vpn_type_combo, True, True, 0)
@@ -2410,11 +2924,26 @@ class ConnectionDialog(Gtk.Dialog):
         self.vpn_config_entry.set_placeholder_text("Select or enter VPN profile/config")
         config_box.pack_start(self.vpn_config_combo, True, True, 0)
         
+        # Shown while the list of configs is being fetched
+        self.vpn_config_spinner = Gtk.Spinner()
+        self.vpn_config_spinner.set_no_show_all(True)
+        config_box.pack_start(self.vpn_config_spinner, False, False, 0)
+        self._config_load_id = 0
+        self._vpn_config_index = {}  # Listed config -> its row in the combo
+        self._closed = False
+        self.connect("destroy", self.on_destroy)
+        
         # Browse button for config file
         self.browse_config_button = Gtk.Button(label="Browse...")
         self.browse_config_button.connect("clicked", self.browse_vpn_config)
         config_box.pack_start(self.browse_config_button, False, False, 0)
         
+        # Refresh button to relist configs instead of using the cached list
+        refresh_config_button = Gtk.Button.new_from_icon_name("view-refresh", Gtk.IconSize.BUTTON)
+        refresh_config_button.set_tooltip_text("Refresh the list of VPN configs")
+        refresh_config_button.connect("clicked", self.on_refresh_vpn_configs)
+        config_box.pack_start(refresh_config_button, False, False, 0)
+        
         # VPN Username (mainly for OpenVPN3)
         self.username_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         vpn_box.pack_start(self.username_box, False, False, 0)
@@ -2549,6 +3078,7 @@ class ConnectionDialog(Gtk.Dialog):
         selected_monitors = self.connection_data.get("selected_monitors", [])
         if selected_monitors:
             self.monitor_entry.set_text(",".join(str(m) for m in selected_monitors))
+        self.monitor_entry.connect("changed", self.on_monitor_entry_changed)
         monitor_box.pack_start(self.monitor_entry, True, True, 0)
         
         identify_btn = Gtk.Button(label="Identify")
@@ -2660,6 +3190,22 @@ class ConnectionDialog(Gtk.Dialog):
         # Add Advanced tab to notebook
         notebook.append_page(advanced_scrolled, Gtk.Label(label="Advanced"))
         
+        # Profile keys stored straight from a checkbox's state
+        self.check_fields = (
+            ("rdp_fullscreen", self.fullscreen_check),
+            ("multimon", self.multimon_check),
+            ("disable_fonts", self.disable_fonts_check),
+            ("disable_wallpaper", self.disable_wallpaper_check),
+            ("disable_themes", self.disable_themes_check),
+            ("disable_aero", self.disable_aero_check),
+            ("disable_drag", self.disable_drag_check),
+            ("compression", self.compression_check),
+            ("clipboard", self.clipboard_check),
+            ("redirect_drives", self.drives_check),
+            ("nla", self.nla_check),
+            ("force_ntlm", self.force_ntlm_check),
+        )
+        
         # Initialize VPN type and configs if editing
         if connection_data:
             # Set VPN type first
@@ -2680,20 +3226,9 @@ class ConnectionDialog(Gtk.Dialog):
                 if self.vpn_type_combo.get_model():
                     self.vpn_type_combo.set_active(0)
             
-            # Load configs for the selected VPN type
+            # Load configs for the selected VPN type; this also puts the
+            # current VPN config in the entry and selects it once listed
             self.load_vpn_configs()
-            
-            # Set current VPN config if editing
-            if "vpn_config" in connection_data:
-                vpn_config = connection_data["vpn_config"]
-                # Always set the text in the entry field
-                self.vpn_config_entry.set_text(vpn_config)
-                # Then try to find and set the matching config in the combo
-                model = self.vpn_config_combo.get_model()
-                for i, row in enumerate(model):
-                    if row[0] == vpn_config:
-                        self.vpn_config_combo.set_active(i)
-                        break
         else:
             # New connection - set defaults
             if self.vpn_type_combo.get_model():
@@ -2785,92 +3320,87 @@ class ConnectionDialog(Gtk.Dialog):
         
         dialog.destroy()
     
-    def load_vpn_configs(self):
-        """Load available VPN configurations based on selected type"""
+    def on_monitor_entry_changed(self, entry):
+        """Flag monitor selections containing items that are not numbers"""
+        _, valid = parse_monitor_list(entry.get_text())
+        style = entry.get_style_context()
+        if valid:
+            style.remove_class(Gtk.STYLE_CLASS_ERROR)
+            entry.set_tooltip_text(None)
+        else:
+            style.add_class(Gtk.STYLE_CLASS_ERROR)
+            entry.set_tooltip_text("Monitor numbers must be separated by commas; other items are ignored")
+    
+    def on_destroy(self, widget):
+        """Stop handling config lists that arrive after the dialog closed"""
+        self._closed = True
+    
+    def on_refresh_vpn_configs(self, widget):
+        """Relist VPN configs, keeping whatever is typed in the entry"""
+        vpn_config = self.vpn_config_entry.get_text()
+        self.load_vpn_configs(refresh=True)
+        self.vpn_config_entry.set_text(vpn_config)
+    
+    def load_vpn_configs(self, refresh=False):
+        """Load available VPN configurations based on selected type.
+
+        The list is filled in by on_vpn_configs_loaded once the manager has
+        it; a spinner shows while it is being fetched.
+        """
         # Clear existing items
         self.vpn_config_combo.remove_all()
+        self._vpn_config_index = {}
+        
+        # Results of an earlier, still running load are ignored
+        self._config_load_id += 1
+        load_id = self._config_load_id
         
         vpn_type = self.vpn_type_combo.get_active_text()
         
         if not vpn_type:
+            self.vpn_config_spinner.stop()
+            self.vpn_config_spinner.hide()
             return
         
-        if vpn_type == "NetworkManager":
-            try:
-                result = subprocess.run(
-                    ["nmcli", "-t", "--escape", "no", "-f", "NAME,TYPE", "connection", "show"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-
-                if result.returncode == 0:
-                    configs_found = []
-                    for line in result.stdout.splitlines():
-                        if ":" not in line:
-                            continue
-                        name, conn_type = line.rsplit(":", 1)
-                        if conn_type in ["vpn", "wireguard"]:
-                            configs_found.append(name)
-
-                    for config in sorted(configs_found):
-                        self.vpn_config_combo.append_text(config)
-            except:
-                pass
-
-        elif vpn_type == "OpenVPN3":
-            try:
-                result = subprocess.run(
-                    ["openvpn3", "configs-list"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines[2:]:  # Skip header
-                        if line.strip() and not line.startswith('-'):
-                            parts = line.split()
-                            if len(parts) >= 1:
-                                config_path = parts[0]
-                                self.vpn_config_combo.append_text(config_path)
-            except:
-                pass
-        
-        elif vpn_type == "WireGuard":
-            # Load WireGuard configs from common locations
-            wg_dirs = [
-                "/etc/wireguard",
-                os.path.expanduser("~/.config/wireguard"),
-                os.path.expanduser("~/wireguard")
-            ]
-            
-            configs_found = []
-            for wg_dir in wg_dirs:
-                if os.path.exists(wg_dir):
-                    try:
-                        for file in os.listdir(wg_dir):
-                            if file.endswith('.conf'):
-                                config_path = os.path.join(wg_dir, file)
-                                # Check if readable
-                                if os.access(config_path, os.R_OK):
-                                    configs_found.append(config_path)
-                                else:
-                                    # Try with sudo access notation
-                                    configs_found.append(f"sudo:{config_path}")
-                    except:
-                        pass
-            
-            # Add found configs to combo
-            for config in sorted(configs_found):
-                self.vpn_config_combo.append_text(config)
-        
         # Restore previous selection if it exists
         if self.connection_data and "vpn_config" in self.connection_data:
             vpn_config = self.connection_data["vpn_config"]
             # Set the text in the entry field
             self.vpn_config_entry.set_text(vpn_config)
+        
+        self.vpn_config_spinner.show()
+        self.vpn_config_spinner.start()
+        self.manager.get_vpn_configs(
+            vpn_type,
+            lambda configs: self.on_vpn_configs_loaded(load_id, configs),
+            refresh=refresh
+        )
+    
+    def on_vpn_configs_loaded(self, load_id, configs):
+        """Fill the config combo with a fetched list of VPN configs"""
+        if self._closed or load_id != self._config_load_id:
+            return
+        
+        self.vpn_config_spinner.stop()
+        self.vpn_config_spinner.hide()
+        
+        vpn_config = self.vpn_config_entry.get_text()
+        
+        # Fill the model while it is detached, so the combo does not react
+        # to every inserted row
+        model = self.vpn_config_combo.get_model()
+        self.vpn_config_combo.set_model(None)
+        index = {}
+        for i, config in enumerate(configs):
+            model.insert_with_valuesv(-1, [0], [config])
+            index.setdefault(config, i)
+        self.vpn_config_combo.set_model(model)
+        self._vpn_config_index = index
+        
+        # Select the entry's config in the list if it is one of them
+        i = index.get(vpn_config)
+        if i is not None:
+            self.vpn_config_combo.set_active(i)
     
     def get_connection_data(self):
         """Get the connection data from the dialog"""
@@ -2907,13 +3437,7 @@ class ConnectionDialog(Gtk.Dialog):
             rdp_host = ""
         
         # Parse monitor selection
-        selected_monitors = []
-        monitor_text = self.monitor_entry.get_text().strip()
-        if monitor_text:
-            try:
-                selected_monitors = [int(m.strip()) for m in monitor_text.split(",")]
-            except:
-                pass
+        selected_monitors, _ = parse_monitor_list(self.monitor_entry.get_text())
         
         # Determine audio mode
         audio_mode = "local"
@@ -2922,7 +3446,7 @@ class ConnectionDialog(Gtk.Dialog):
         elif self.audio_disabled_radio.get_active():
             audio_mode = "disabled"
         
-        return {
+        data = {
             "name": name,
             "connection_mode": connection_mode,
             "vpn_type": self.vpn_type_combo.get_active_text() if connection_mode != "RDP Only" else "",
@@ -2931,22 +3455,12 @@ class ConnectionDialog(Gtk.Dialog):
             "rdp_host": rdp_host,
             "rdp_username": self.rdp_username_entry.get_text().strip() if connection_mode != "VPN Only" else "",
             "rdp_domain": self.rdp_domain_entry.get_text().strip() if connection_mode != "VPN Only" else "",
-            "rdp_fullscreen": self.fullscreen_check.get_active(),
             "rdp_resolution": self.resolution_combo.get_active_text(),
-            "multimon": self.multimon_check.get_active(),
             "selected_monitors": selected_monitors,
-            "disable_fonts": self.disable_fonts_check.get_active(),
-            "disable_wallpaper": self.disable_wallpaper_check.get_active(),
-            "disable_themes": self.disable_themes_check.get_active(),
-            "disable_aero": self.disable_aero_check.get_active(),
-            "disable_drag": self.disable_drag_check.get_active(),
-            "compression": self.compression_check.get_active(),
-            "audio_mode": audio_mode,
-            "clipboard": self.clipboard_check.get_active(),
-            "redirect_drives": self.drives_check.get_active(),
-            "nla": self.nla_check.get_active(),
-            "force_ntlm": self.force_ntlm_check.get_active()
+            "audio_mode": audio_mode
         }
+        data.update((key, check.get_active()) for key, check in self.check_fields)
+        return data
     
     def show_command_preview(self, widget=None):
         """Show the xfreerdp command line for the current options in a copyable popup."""
@@ -3017,9 +3531,43 @@ class ConnectionDialog(Gtk.Dialog):
                 self.show_info("No monitors detected")
                 return
 
+            # All ID windows live on the same screen and share one stylesheet,
+            # parsed once. It is attached to the ID windows only: installing
+            # it for the whole screen would restyle the app's own windows.
+            screen = display.get_default_screen()
+            rgba_visual = screen.get_rgba_visual()
+            transparent = rgba_visual is not None and screen.is_composited()
+
+            css_provider = Gtk.CssProvider()
+            window_bg = b"rgba(0,0,0,0)" if transparent else b"#2196F3"
+            css_provider.load_from_data(b"""
+                window {
+                    background-color: %s;
+                }
+                box.badge {
+                    background-color: rgba(33, 150, 243, 0.92);
+                    border-radius: 28px;
+                    padding: 24px 56px;
+                }
+            """ % window_bg)
+
+            close_markup = '<span font="18" foreground="white">Press ESC or click to close</span>'
+
             # Create identification windows
             id_windows = []
 
+            # One handler closes every ID window, whether from a click, ESC
+            # or the auto-close timeout
+            def destroy_all(*args):
+                for w in id_windows:
+                    w.destroy()
+                id_windows.clear()
+                return False
+
+            def on_key_press(window, event):
+                if event.keyval == Gdk.KEY_Escape:
+                    destroy_all()
+
             for index in range(n_monitors):
                 monitor = display.get_monitor(index)
                 geo = monitor.get_geometry()
@@ -3030,9 +3578,6 @@ class ConnectionDialog(Gtk.Dialog):
                 window.set_decorated(False)
                 window.set_keep_above(True)
 
-                screen = window.get_screen()
-                rgba_visual = screen.get_rgba_visual()
-                transparent = rgba_visual is not None and screen.is_composited()
                 if transparent:
                     window.set_visual(rgba_visual)
                     window.set_app_paintable(True)
@@ -3044,62 +3589,39 @@ class ConnectionDialog(Gtk.Dialog):
                 badge.get_style_context().add_class("badge")
                 window.add(badge)
 
-                css_provider = Gtk.CssProvider()
-                window_bg = b"rgba(0,0,0,0)" if transparent else b"#2196F3"
-                css_provider.load_from_data(b"""
-                    window {
-                        background-color: %s;
-                    }
-                    box.badge {
-                        background-color: rgba(33, 150, 243, 0.92);
-                        border-radius: 28px;
-                        padding: 24px 56px;
-                    }
-                    box.badge label {
-                        color: white;
-                        font-size: 120px;
-                        font-weight: bold;
-                    }
-                    box.badge label.info {
-                        font-size: 24px;
-                        font-weight: normal;
-                    }
-                """ % window_bg)
-
                 style_context = window.get_style_context()
                 style_context.add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
                 badge.get_style_context().add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
 
+                # Labels are styled with Pango markup rather than CSS classes
                 # Monitor number
-                number_label = Gtk.Label(label=str(index))
+                number_label = Gtk.Label()
+                number_label.set_markup(f'<span font="90" weight="bold" foreground="white">{index}</span>')
                 badge.pack_start(number_label, True, True, 0)
 
                 # Monitor info
-                info_label = Gtk.Label(label=f"{name}\n{geo.width}x{geo.height}")
-                info_label.get_style_context().add_class("info")
+                info_label = Gtk.Label()
+                info_label.set_markup(
+                    f'<span font="18" foreground="white">'
+                    f'{GLib.markup_escape_text(name)}\n{geo.width}x{geo.height}</span>'
+                )
                 badge.pack_start(info_label, False, False, 0)
 
                 # Close instruction
-                close_label = Gtk.Label(label="Press ESC or click to close")
-                close_label.get_style_context().add_class("info")
+                close_label = Gtk.Label()
+                close_label.set_markup(close_markup)
                 badge.pack_start(close_label, False, False, 0)
 
                 # Connect events
-                window.connect("button-press-event", lambda w, e: w.destroy())
-                window.connect("key-press-event", lambda w, e: w.destroy() if e.keyval == Gdk.KEY_Escape else None)
+                window.connect("button-press-event", destroy_all)
+                window.connect("key-press-event", on_key_press)
 
                 window.show_all()
                 window.fullscreen_on_monitor(window.get_screen(), index)
                 id_windows.append(window)
 
             # Auto-close after 5 seconds
-            def close_all():
-                for w in id_windows:
-                    if w.get_visible():
-                        w.destroy()
-                return False
-
-            GLib.timeout_add_seconds(5, close_all)
+            GLib.timeout_add_seconds(5, destroy_all)
 
         except Exception as e:
             self.show_error(f"Error identifying monitors: {str(e)}")